@@ -6,14 +6,20 @@ import pandas as pd
 import numpy as np
 import math
 import copy
-import joblib
+import json
+import re
 
-from .utils import _get_bin_count, _get_linecount, make_bins
+from .utils import _get_bin_count, _get_linecount, _scan_file, \
+    _make_bin_labels, make_bins, _download
 from .plots import heatmap
-from .models import SMPS
+from . import models
+from .models import SMPS, GenericParticleSizer, ValidationError
 
 
-__all__ = ["smps_from_txt", "load_sample"]
+__all__ = ["smps_from_txt", "load_sample", "load_parquet"]
+
+# matches column labels that are plain numbers (i.e., bin midpoints)
+_NUMERIC_RE = re.compile(r"^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
 
 
 def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
@@ -58,13 +64,24 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
 
     # determine the number of rows of meta information; can be defined
     meta_num_lines = kwargs.pop("meta_num_lines", None)
+    nbins = None
     if not meta_num_lines:
-        meta_num_lines = _get_linecount(
-            fpath, 
-            keyword='Sample #', 
-            encoding=encoding, 
-            delimiter=delimiter
-        )
+        if column:
+            # column files also need the number of bins, so find both 
+            # while reading the file once
+            meta_num_lines, nbins = _scan_file(
+                fpath, 
+                keyword='Sample #', 
+                encoding=encoding, 
+                delimiter=delimiter
+            )
+        else:
+            meta_num_lines = _get_linecount(
+                fpath, 
+                keyword='Sample #', 
+                encoding=encoding, 
+                delimiter=delimiter
+            )
 
     # read and store the meta information
     meta = pd.read_table(
@@ -107,11 +124,12 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
         )
 
         # Retrieve the number of bins in the file
-        nbins = _get_bin_count(
-            fpath=fpath, 
-            delimiter=delimiter, 
-            encoding=encoding
-        )
+        if nbins is None:
+            nbins = _get_bin_count(
+                fpath=fpath, 
+                delimiter=delimiter, 
+                encoding=encoding
+            )
 
         # Read the table of raw data
         data = pd.read_table(
@@ -126,7 +144,7 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
         data = data.iloc[:, 1:].T
 
         # Alter the column names
-        data.columns = ['bin{}'.format(i) for i in range(nbins)]
+        data.columns = _make_bin_labels(nbins)
         data.index = ts['timestamp']
 
         # Read the table of stats
@@ -180,15 +198,12 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
         del data['Date'], data['Start Time']
 
         # grab the midpoint diameters
-        midpoints = []
-        for col in data.columns:
-            try:
-                float(col)
-                midpoints.append(col)
-            except ValueError:
-                pass
+        midpoints = [
+            col for col in data.columns 
+            if isinstance(col, str) and _NUMERIC_RE.match(col)
+        ]
 
-        bin_labels = ["bin{}".format(i) for i in range(len(midpoints))]
+        bin_labels = _make_bin_labels(len(midpoints))
 
         # rename the bins
         data.rename(
@@ -196,7 +211,7 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
             inplace=True
         )
 
-        midpoints = np.array([float(i) for i in midpoints])
+        midpoints = np.asarray(midpoints, dtype=float)
 
     # generate the bins
     low_col_name = kwargs.pop(
@@ -238,13 +253,21 @@ def smps_from_txt(fpath, column=True, delimiter=',', as_dict=False, **kwargs):
                     bin_labels=bin_labels, units=units, weight=weight)
 
 
-def load_sample(label="boston"):
+def load_sample(label="boston", cache=False, data_home=None):
     """Load one of the example datasets provided.
     
     Parameters
     ----------
     label : str, default='boston'
             Choose the example dataset to load. Should be one of ['boston', 'chamber']
+    cache : bool, default=False
+            If True, the dataset is downloaded once and saved to `data_home`; 
+            later calls load the local copy instead of downloading it again. 
+            If False, nothing is written to disk.
+    data_home : str, default=None
+            The directory in which to cache the datasets when `cache` is True. 
+            Defaults to the `SMPS_DATA` environment variable if set, or 
+            `~/.cache/py-smps` otherwise.
     
     Returns
     -------
@@ -261,6 +284,10 @@ def load_sample(label="boston"):
     
     >>> obj = smps.io.load_sample('boston')
     
+    Keep a local copy in `~/.cache/py-smps` for later calls:
+    
+    >>> obj = smps.io.load_sample('boston', cache=True)
+    
     """
     assert(label in ["boston", "chamber"]), "Invalid option chosen \
     for the label"
@@ -278,7 +305,11 @@ def load_sample(label="boston"):
         }
     }
 
-    m = smps_from_txt(fpath=files[label]['uri'], column=files[label]['column'], as_dict=True)
+    fpath = files[label]['uri']
+    if cache:
+        fpath = _download(fpath, data_home=data_home)
+
+    m = smps_from_txt(fpath=fpath, column=files[label]['column'], as_dict=True)
 
     # convert to an SMPS instance
     return SMPS(
@@ -289,3 +320,62 @@ def load_sample(label="boston"):
         weight=m['weight'], 
         units=m['units']
     )
+
+
+def load_parquet(fpath):
+    """Load a model that was saved in parquet format.
+    
+    Parameters
+    ----------
+    fpath : str
+            The filepath of the parquet file. The JSON file written alongside 
+            it (at `fpath + '.json'`) must also exist.
+    
+    Returns
+    -------
+    smps.models.GenericParticleSizer
+        An instance of the same model class that was saved.
+    
+    See Also
+    --------
+    smps.models.GenericParticleSizer.dump
+    
+    Examples
+    --------
+    
+    Save a model and load it back:
+    
+    >>> obj.dump("path-to-file.parquet", ftype="parquet")
+    >>> obj = smps.io.load_parquet("path-to-file.parquet")
+    
+    """
+    with open(fpath + ".json", "r") as f:
+        info = json.load(f)
+
+    data = pd.read_parquet(fpath)
+
+    # Only rebuild classes that are models, whatever the file says
+    model = getattr(models, info['model'], None)
+    if not (isinstance(model, type) and issubclass(model, GenericParticleSizer)):
+        raise ValidationError(f"{info['model']} is not a particle sizer model")
+
+    # The data was saved after all unit conversions and bin weights were 
+    # applied, so initialize using the base class to skip re-applying them; 
+    # the subclasses only set defaults for the bins, which are restored here
+    obj = model.__new__(model)
+    GenericParticleSizer.__init__(
+        obj, 
+        data=data, 
+        bins=np.array(info['bins']), 
+        bin_labels=info['bin_labels'], 
+        meta=info['meta'], 
+        weight=info['meta']['weight'], 
+        units=info['meta']['units'], 
+        fmt='dndlogdp', 
+        dtype=info.get('dtype')
+    )
+
+    if 'bin_weights' in info:
+        obj.bin_weights = np.array(info['bin_weights'])
+
+    return obj
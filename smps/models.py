@@ -7,10 +7,10 @@ import pandas as pd
 import math
 import copy
 import sys
-import joblib
 import json
 import logging
-from .utils import make_bins
+import functools
+from .utils import make_bins, _make_bin_labels
 
 logging.basicConfig(stream=sys.stdout, level=logging.WARN)
 
@@ -32,6 +32,95 @@ class ValidationError(Exception):
         self.msg = msg
 
 
+def _bin_factors(left, right, dmin, dmax):
+    """
+    Compute the fraction of each bin that falls between `dmin` 
+    and `dmax`, i.e., the overlap between each bin and the 
+    range [dmin, dmax] divided by the width of the bin.
+
+    :param left: The lower boundary of each bin.
+    :type left: numpy array
+    :param right: The upper boundary of each bin.
+    :type right: numpy array
+    :param dmin: The minimum particle diameter.
+    :type dmin: float
+    :param dmax: The maximum particle diameter.
+    :type dmax: float
+    :return: An array of multipliers between 0 and 1, one per bin.
+    :rtype: numpy array
+    """
+    return np.clip(
+        (np.minimum(right, dmax) - np.maximum(left, dmin)) / (right - left), 
+        0., 
+        1.
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_bin_factors(left, right, dmin, dmax):
+    """
+    Memoized version of `_bin_factors` keyed on tuples of the 
+    bin boundaries. The returned array is shared between callers 
+    and is therefore read-only.
+    """
+    factors = _bin_factors(np.asarray(left), np.asarray(right), dmin, dmax)
+    factors.setflags(write=False)
+
+    return factors
+
+
+def _frozen_bins(boundaries):
+    """
+    Build a read-only 3xn array of bins from the bin boundaries so 
+    that it can be shared safely between instances.
+
+    :param boundaries: The bin boundaries in microns.
+    :type boundaries: numpy array
+    :return: A read-only 3xn array of bins.
+    :rtype: numpy array
+    """
+    bins = make_bins(boundaries=boundaries)
+    bins.setflags(write=False)
+
+    return bins
+
+
+# default bins for each instrument
+_OPCN2_BINS = _frozen_bins(np.array([
+    0.38, 0.54, 0.78, 1.05, 1.34, 1.59, 2.07, 3., 
+    4., 5., 6.5, 8., 10., 12., 14., 16., 17.5
+]))
+
+_OPCN3_BINS = _frozen_bins(np.array([
+    0.35, 0.46, 0.66, 1., 1.3, 1.7, 2.3, 3.,
+    4., 5.2, 6.5, 8., 10., 12., 14., 16., 18.,
+    20., 22., 25., 28., 31., 34., 37., 40.
+]))
+
+# the MODULAIR drops the last few OPC-N3 bins
+_MODULAIR_BINS = _frozen_bins(np.array([
+    0.35, 0.46, 0.66, 1., 1.3, 1.7, 2.3, 3.,
+    4., 5.2, 6.5, 8., 10., 12., 14., 16., 18.,
+    20., 22.
+]))
+
+# default left and right bounds according to Handix
+_POPS_BINS = _frozen_bins(1e-3*np.array([
+    132, 144, 158, 174, 191, 209, 229, 270, 324, 
+    473, 594, 1009, 1294, 1637, 2148, 2864, 3648
+]))
+
+_PARTICLES_PLUS_BINS = _frozen_bins(np.array([
+    0.3, 0.5, 0.7, 1., 2.5, 10.0, 10.1
+]))
+
+_GRIMM11D_BINS = _frozen_bins(np.array([
+    0.25, 0.28, 0.3, 0.35, 0.4, 0.45, 0.5, 0.58, 0.65, 0.7, 
+    0.8, 1.0, 1.3, 1.6, 2.0, 2.5, 3.0, 3.5, 4., 5., 6.5, 7.5, 
+    8.5, 10., 12.5, 15., 17.5, 20., 25., 30., 32., 35.
+]))
+
+
 class GenericParticleSizer(object):
     """
     The base class for a Generic Size-Resolving Particle Instrument.
@@ -59,6 +148,10 @@ class GenericParticleSizer(object):
         An optional kwarg to name the bins if not already named.
     fmt : str, default='dn' 
         Optional kwarg describing the default data format. One of ('dn', 'dndlogdp').
+    dtype : numpy dtype, default=None
+        An optional dtype to store the binned data as (e.g., ``np.float32`` to 
+        halve the memory footprint). By default, the data is left as is. 
+        Calculations are always carried out in float64.
     
     See Also
     --------
@@ -83,7 +176,13 @@ class GenericParticleSizer(object):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
 
-        self.data = data.copy(deep=True)
+        # the data is not copied here: the binned data is rebuilt 
+        # below, which leaves `self.data` independent of `data`
+        self.data = data
+
+        # make sure bins is has three columns
+        assert(bins.shape[1] == 3), "`bins` must be an Nx3 array."
+
         self.bins = bins
         self.meta = kwargs.pop('meta', dict())
         self.bin_labels = kwargs.pop('bin_labels', None)
@@ -103,57 +202,95 @@ class GenericParticleSizer(object):
         assert(len(self.bin_labels) > 0), ("No bin labels have been "
         + "found or specified.")
 
-        # make sure bins is has three columns
-        assert(self.bins.shape[1] == 3), "`bins` must be an Nx3 array."
-
         # we always work with our units in um, so convert
         if kwargs.pop('dp_units', 'um') == 'nm':
             self.bins = self.bins * 1e-3
 
+        # multiply everything by the bin weights
+        # if ones, this will have no effect
+        scale = np.asarray(self.bin_weights, dtype=np.float64)
+
         # if the data is in a format other than 
         # [weight='number', units='dw/dlogdp']
         if kwargs.pop('fmt', 'dn') == 'dn':
-            self.data[self.bin_labels] = (
-                self
-                .data[self.bin_labels]
-                .div(self.dlogdp)
-            )
+            scale = scale / self.dlogdp
 
-        # multiply everything by the bin weights
-        # if ones, this will have no effect
-        self.data[self.bin_labels] = (
-            self
-            .data[self.bin_labels]
-            .mul(self.bin_weights)
-        )
+        # scale a private copy of the histogram in place with 
+        # a single pass
+        hist = self.data[self.bin_labels].to_numpy(dtype=np.float64, copy=True)
+        hist *= scale
+
+        # optionally downcast the histogram to save memory
+        dtype = kwargs.pop("dtype", None)
+        if dtype is not None:
+            hist = hist.astype(dtype)
+
+        self.data = self._replace_bins(self.data, hist)
+
+    def __setstate__(self, state):
+        # models pickled before `bins` became a property stored it 
+        # directly; route it through the setter to rebuild the cache
+        bins = state.pop("bins", None)
+        self.__dict__.update(state)
+
+        if bins is not None:
+            self.bins = bins
+
+    @property
+    def bins(self):
+        """
+        A 3xn array defining the left, mid, and right boundaries (in µm) 
+        for each particle size bin.
+        """
+        return self._bins
+
+    @bins.setter
+    def bins(self, bins):
+        self._bins = bins
+
+        # these only depend on the bins, so compute them once here 
+        # rather than on every access
+        self._midpoints = bins[:, 1]
+        self._log_midpoints = np.log(self._midpoints)
+        self._dlogdp = np.log10(bins[:, -1] / bins[:, 0])
+
+        # surface area and volume of a sphere, sharing the radius
+        radius = self._midpoints / 2
+        self._s_multiplier = 4 * np.pi * radius**2
+        self._v_multiplier = self._s_multiplier * radius / 3
+
+        # the cached arrays are shared by every caller
+        for arr in (self._midpoints, self._log_midpoints, self._dlogdp, 
+                    self._s_multiplier, self._v_multiplier):
+            arr.setflags(write=False)
 
     @property
     def s_multiplier(self):
         """
         Per particle surface area representing the mean particle in each bin.
         """
-        return 4 * np.pi * (self.bins[:, 1]/2)**2
+        return self._s_multiplier
 
     @property
     def v_multiplier(self):
         """
         Per particle volume representing the mean particle in each bin.
         """
-        return (4./3)*np.pi*(self.bins[:, 1]/2)**3
+        return self._v_multiplier
 
     @property
     def midpoints(self):
         """
         Midpoint particle diameter in each bin.
         """
-        return self.bins[:, 1]
+        return self._midpoints
 
     @property
     def dlogdp(self):
         """
         Log difference between the upper and lower bound of each bin.
         """
-        return np.log10(self.bins[:, -1]) - np.log10(self.bins[:, 0])
+        return self._dlogdp
 
     @property
     def dn(self):
@@ -161,7 +298,7 @@ class GenericParticleSizer(object):
         The number concentration per bin. Can otherwise be represented as :math:`dN/dD_p`. Units 
         are pp/cm3.
         """
-        return self.dndlogdp.mul(self.dlogdp)
+        return self._scale_histogram(self.dlogdp)
 
     @property
     def dndlogdp(self):
@@ -176,14 +313,14 @@ class GenericParticleSizer(object):
         """
         Can otherwise be represented as :math:`dD/dlogD_p`.
         """
-        return self.dndlogdp.mul(self.midpoints)
+        return self._scale_histogram(self.midpoints)
 
     @property
     def ds(self):
         """
         Surface area per bin.
         """
-        return self.dn.mul(self.s_multiplier)
+        return self._scale_histogram(self.dlogdp * self.s_multiplier)
 
     @property
     def dsdlogdp(self):
@@ -191,14 +328,14 @@ class GenericParticleSizer(object):
         Log normalized surface area per bin. Otherwise represented as :math:`dS/dlogDp`.
         Units are: µm2/cm3.
         """
-        return self.dndlogdp.mul(self.s_multiplier)
+        return self._scale_histogram(self.s_multiplier)
 
     @property
     def dv(self):
         """
         Volume per bin.
         """
-        return self.dvdlogdp.mul(self.dlogdp)
+        return self._scale_histogram(self.dlogdp * self.v_multiplier)
 
     @property
     def dvdlogdp(self):
@@ -206,15 +343,75 @@ class GenericParticleSizer(object):
         Log normalized volume per bin. Can otherwise be represented as
         :math:`dV/dlogDp`. Units are µm3/cm3.
         """
-        return self.dndlogdp.mul(self.v_multiplier)
+        return self._scale_histogram(self.v_multiplier)
+
+    def _scale_histogram(self, factors):
+        """
+        Multiply each bin of the log normalized histogram by a 
+        per-bin factor.
+        
+        :param factors: An array of factors, one per bin, in the 
+            same order as `self.bin_labels`.
+        :type factors: numpy array
+        :return: The scaled histogram.
+        :rtype: DataFrame
+        """
+        hist = self.dndlogdp
+        arr = hist.to_numpy()
+
+        # multiply positionally (and in the histogram's dtype) to skip
+        # pandas' label alignment and any dtype promotion
+        if arr.dtype.kind == 'f':
+            factors = factors.astype(arr.dtype, copy=False)
+
+        return pd.DataFrame(
+            arr * factors,
+            index=hist.index,
+            columns=hist.columns,
+            copy=False
+        )
+
+    def _histogram_array(self):
+        """
+        The log normalized histogram as a dense, row-major float64 
+        array for use in the row-wise reductions.
+        
+        pandas stores each block column-major, so `to_numpy` on the 
+        bins typically returns a Fortran-ordered view; copying it once 
+        here keeps each record contiguous in memory.
+        
+        :return: An array of shape (records, bins).
+        :rtype: numpy array
+        """
+        return np.ascontiguousarray(
+            self.dndlogdp.to_numpy(dtype=np.float64))
+
+    def _weighted_row_sums(self, hist, weights):
+        """
+        Compute the weighted sum over the bins of each record as a 
+        single matrix product. NaNs are treated as zeros to match 
+        the behavior of DataFrame.sum.
+        
+        :param hist: An array of shape (records, bins).
+        :type hist: numpy array
+        :param weights: An array of per-bin weights with shape (bins,) 
+            or (bins, k) to compute k sums at once.
+        :type weights: numpy array
+        :return: The weighted sums with shape (records,) or (records, k).
+        :rtype: numpy array
+        """
+        return np.where(np.isnan(hist), 0., hist) @ weights
 
     @property
     def scan_stats(self):
         """
         Return the non-binned data.
         """
-        return self.data[list(set(self.data.columns)
-                              - set(self.bin_labels))]
+        bin_labels = set(self.bin_labels)
+
+        # keep the columns in the order they appear in `data`
+        return self.data[[c for c in self.data.columns 
+                          if c not in bin_labels]]
         
     def copy(self):
         """
@@ -227,7 +424,21 @@ class GenericParticleSizer(object):
         """
         return copy.deepcopy(self)
 
-    def dump(self, filepath):
+    def _copy_with_data(self, data):
+        """
+        Return a deep copy of the model which holds `data` instead 
+        of a copy of the current data.
+
+        :param data: The data for the new model. It is used as is.
+        :type data: DataFrame
+        :return: A new model.
+        :rtype: GenericParticleSizer
+        """
+        # seed the memo so that deepcopy substitutes `data` rather 
+        # than copying a frame that would be thrown away
+        return copy.deepcopy(self, memo={id(self.data): data})
+
+    def dump(self, filepath, ftype='obj'):
         """
         Save a copy of the model to disk.
         
@@ -235,89 +446,123 @@ class GenericParticleSizer(object):
         ----------
         filepath : str
             The filepath to save the file at.
+        ftype : str, default='obj'
+            The file format. One of ('obj', 'parquet'). If 'obj', the entire 
+            model is pickled using joblib. If 'parquet', the data is saved as 
+            a compressed parquet file (requires pyarrow) and the bins, bin 
+            labels, bin weights, dtype, and meta information are saved 
+            alongside it as JSON at `filepath + '.json'`.
         
         Returns
         -------
         filepath : list
             The list of filepaths where data was saved.
         
+        See Also
+        --------
+        smps.io.load_parquet
+        
         Examples
         --------
         
         >>> model.dump(filepath="path-to-file.sav")
         
+        Save the model as parquet:
+        
+        >>> model.dump(filepath="path-to-file.parquet", ftype="parquet")
+        
         """
-        return joblib.dump(self, filepath)
+        assert(ftype in ("obj", "parquet")), "Invalid `ftype`"
+
+        if ftype == "obj":
+            # joblib is slow to import and only needed here
+            import joblib
+
+            return joblib.dump(self, filepath)
+
+        # save the data as a snappy-compressed, columnar file
+        self.data.to_parquet(filepath, compression="snappy")
+
+        # keep the dtype of the binned data if it was downcast
+        dtype = self.data[self.bin_labels[0]].dtype
+        dtype = None if dtype == np.float64 else dtype.name
+
+        # save everything else needed to rebuild the model
+        meta_filepath = filepath + ".json"
+        with open(meta_filepath, "w") as f:
+            json.dump(
+                dict(
+                    model=self.__class__.__name__, 
+                    bins=self.bins.tolist(), 
+                    bin_labels=list(self.bin_labels), 
+                    bin_weights=np.asarray(self.bin_weights, dtype=np.float64).tolist(), 
+                    dtype=dtype, 
+                    meta=self.meta
+                ), 
+                f, 
+                default=str
+            )
+
+        return [filepath, meta_filepath]
 
-    def _subselect_frame(self, df, dmin=0., dmax=1e3):
+    def _replace_bins(self, df, hist):
         """
-        Sub-select the bins that are used to make calculations by
-        zeroing out bins which are outside of the range. This
-        is similar to a slice, except in the bin-dimension 
-        rather than the time-dimension. Edge cases are 
-        appropriately weighted.
+        Replace the bins of a DataFrame with a histogram array. The 
+        bins are stored as a single 2D block rather than one block 
+        per column, and the original column order is kept.
 
-        Units are in microns.
-        
-        :param df: A DataFrame with bins as columns
+        :param df: A DataFrame with bins as columns.
         :type df: DataFrame
-        :param dmin: The minimum particle diameter in microns to 
-            be included.
-        :type dmin: float
-        :param dmax: The maximum particle diameter in microns to 
-            be included.
-        :type dmax: float
-        :return: A copy of `df` with the undesired columns
-            zeroed out.
+        :param hist: An array with one column per bin.
+        :type hist: numpy array
+        :return: A new DataFrame holding `hist` in place of the 
+            bins and a copy of all other columns.
         :rtype: DataFrame
         """
-        # generate an array of factors to multiply by
-        factors = np.zeros(self.bins.shape[0])
+        return pd.concat([
+            pd.DataFrame(hist, index=df.index, columns=self.bin_labels),
+            df.drop(columns=self.bin_labels)
+        ], axis=1)[df.columns]
+    
+    def _subselect_array(self, arr, dmin=0., dmax=1e3):
+        """
+        Sub-select the bins of a histogram array by zeroing out 
+        bins which are outside of the range. This is similar to a 
+        slice, except in the bin-dimension rather than the 
+        time-dimension. Edge cases are appropriately weighted.
 
-        for i, b in enumerate(self.bins):
-            if b[0] >= dmin and b[-1] <= dmax:
-                factors[i] = 1
-            if dmin >= b[0] and dmin < b[-1]:
-                factors[i] = (b[-1] - dmin) / (b[-1] - b[0])
-            if dmax >= b[0] and dmax < b[-1]:
-                factors[i] = (dmax - b[0]) / (b[-1] - b[0])
+        Units are in microns.
 
-        # copy the dataframe
-        cpy = df.copy()
+        :param arr: An array with bins as columns.
+        :type arr: numpy array
+        :param dmin: The minimum particle diameter in microns.
+        :type dmin: float
+        :param dmax: The maximum particle diameter in microns.
+        :type dmax: float
+        :return: A new array with the undesired columns zeroed out.
+        :rtype: numpy array
+        """
+        return arr * self._subselect_factors(dmin=dmin, dmax=dmax)
 
-        # multiply the histogram by the factors we just calculated
-        cpy[self.bin_labels] = cpy[self.bin_labels].mul(factors)
+    def _subselect_factors(self, dmin=0., dmax=1e3):
+        """
+        Return the fraction of each bin that falls between `dmin` 
+        and `dmax`. Factors are cached across calls with the same 
+        bins and size cuts.
 
-        return cpy
-    
-    def _subselect_bins(self, **kwargs):
-        """Return an array of multipliers corresponding to the 
-        percentage of a given bin to use in a calculation based 
-        on the size cutoffs defined.
-        
-        Args:
-            bins (array): Array of bins
-            dmin (float): Minimum particle diameter
-            dmax (float): Maximum particle diameter
-        """
-        bins = kwargs.pop("bins")
-        dmin = kwargs.pop("dmin")
-        dmax = kwargs.pop("dmax")
-        
-        # Create a placeholder for the factors
-        factors = np.zeros(bins.shape[0])
-        
-        for i, b in enumerate(bins):
-            if b[0] >= dmin and b[-1] <= dmax:
-                factors[i] = 1.
-            
-            if dmin >= b[0] and dmin < b[-1]:
-                factors[i] = (b[-1] - dmin) / (b[-1] - b[0])
-            
-            if dmax >= b[0] and dmax < b[-1]:
-                factors[i] = (dmax - b[0]) / (b[-1] - b[0])
-        
-        return factors
+        :param dmin: The minimum particle diameter in microns.
+        :type dmin: float
+        :param dmax: The maximum particle diameter in microns.
+        :type dmax: float
+        :return: A read-only array of multipliers, one per bin.
+        :rtype: numpy array
+        """
+        return _cached_bin_factors(
+            tuple(self.bins[:, 0]), 
+            tuple(self.bins[:, -1]), 
+            float(dmin), 
+            float(dmax)
+        )
 
     def stats(self, weight='number', dmin=0., dmax=1e3, rho=1.65, **kwargs):
         """
@@ -360,114 +605,70 @@ class GenericParticleSizer(object):
         # remove the weight from the kwargs
         assert(weight in ["number", "surface", "volume", "mass"])
 
-        # initialize an empty dataframe to hold the results
-        res = pd.DataFrame(index=self.data.index)
-
-        # subselect the dataframe to only include 
+        # subselect the histogram to only include 
         # diameters of interest
-        cpy = self.copy()
-        cpy.data = cpy._subselect_frame(cpy.data, dmin=dmin, dmax=dmax, **kwargs)
-
-        # drop all rows that are completely NaN
-        cpy.data = cpy.data.dropna(how='all')
-
-        # make a shortcut for the index to inject
-        idx = cpy.data.index
-
-        # calculate the total number of particles
-        res.loc[idx, "number"] = cpy.dn.sum(axis=1)
-        res.loc[idx, "surface_area"] = cpy.ds.sum(axis=1)
-        res.loc[idx, "volume"] = cpy.dv.sum(axis=1)
-        res.loc[idx, "mass"] = cpy.dv.mul(rho).sum(axis=1)
-
-        if weight == "number":
-            res.loc[idx, "AM"] = (
-                1e3*cpy.dn.mul(self.midpoints).sum(axis=1) 
-                / res.loc[idx, "number"]
-            )
-            res.loc[idx, "GM"] = 1e3*np.exp(
-                cpy.dn.mul(np.log(self.midpoints), axis=1).sum(axis=1) 
-                / res.loc[idx, "number"]
-            )
-            rename_cols_dict = dict(zip(
-                cpy.dndlogdp.columns, 
-                cpy.midpoints
-            ))
-            res.loc[idx, "Mode"] = 1e3 * (
-                cpy
-                .dndlogdp
-                .rename(columns=rename_cols_dict)
-                .idxmax(axis=1)
-            )
-
-            tmp = cpy.dn.assign(GM=res.loc[idx, 'GM'].values)
-        elif weight == "surface":
-            res.loc[idx, "AM"] = 1e3 * (
-                cpy
-                .ds
-                .mul(self.midpoints)
-                .sum(axis=1) 
-                / res.loc[idx, "surface_area"]
-            )
-            res.loc[idx, "GM"] = 1e3 * np.exp(
-                cpy
-                .ds
-                .mul(np.log(self.midpoints), axis=1)
-                .sum(axis=1) 
-                / res.loc[idx, "surface_area"]
-            )
-            rename_cols_dict = dict(zip(
-                cpy.dsdlogdp.columns, 
-                cpy.midpoints
-            ))
-            res.loc[idx, "Mode"] = 1e3 * (
-                cpy
-                .dsdlogdp
-                .rename(columns=rename_cols_dict)
-                .idxmax(axis=1)
-            )
+        hist = self._subselect_array(
+            self._histogram_array(), dmin=dmin, dmax=dmax)
+
+        # rows that are completely NaN are left as NaN in the results
+        empty = self.data.isna().all(axis=1).to_numpy()
+
+        # the per-bin weights to convert dN/dlogDp to each moment
+        w_number = self.dlogdp
+        w_surface = w_number * self.s_multiplier
+        w_volume = w_number * self.v_multiplier
+        w = dict(number=w_number, surface=w_surface).get(weight, w_volume)
+
+        # compute every weighted sum with a single matrix multiplication
+        sums = self._weighted_row_sums(hist, np.column_stack([
+            w_number, 
+            w_surface, 
+            w_volume, 
+            w * self.midpoints, 
+            w * self._log_midpoints
+        ]))
+
+        # the total for the chosen weight
+        total = sums[:, dict(number=0, surface=1).get(weight, 2)]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            am = 1e3 * sums[:, 3] / total
+            gm = 1e3 * np.exp(sums[:, 4] / total)
+
+        # the mode is the midpoint of the max of the log-normalized 
+        # histogram for the chosen weight; NaNs are skipped and rows 
+        # without any values are left as NaN
+        w_log = dict(
+            number=1., surface=self.s_multiplier).get(weight, self.v_multiplier)
+
+        hist_log = hist * w_log
+        missing = np.isnan(hist_log)
+        
+        mode = 1e3 * self.midpoints[
+            np.argmax(np.where(missing, -np.inf, hist_log), axis=1)]
+        mode[missing.all(axis=1)] = np.nan
 
-            tmp = cpy.ds.assign(GM=res.loc[idx, 'GM'].values)
-        else:
-            res.loc[idx, "AM"] = 1e3 * (
-                cpy
-                .dv
-                .mul(self.midpoints)
-                .sum(axis=1) 
-                / res.loc[idx, "volume"]
-            )
-            res.loc[idx, "GM"] = 1e3 * np.exp(
-                cpy
-                .dv
-                .mul(np.log(self.midpoints), axis=1)
-                .sum(axis=1) 
-                / res.loc[idx, "volume"]
-            )
-            rename_cols_dict = dict(zip(
-                cpy.dvdlogdp.columns, 
-                cpy.midpoints))
-            res.loc[idx, "Mode"] = 1e3 * (
-                cpy
-                .dvdlogdp
-                .rename(columns=rename_cols_dict)
-                .idxmax(axis=1)
-            )
+        # calculate the GSD before the mass scaling is applied to the GM
+        gsd = self._gsd(hist * w, gm * 1e-3)
 
-            tmp = cpy.dv.assign(GM=res.loc[idx, 'GM'].values)
-        
         if weight == "mass":
-            res.loc[idx, "AM"] = res.loc[idx, "AM"] * rho
-            res.loc[idx, "GM"] = res.loc[idx, "GM"] * rho
-            res.loc[idx, "Mode"] = res.loc[idx, "Mode"] * rho
-        
-        
-        # calculate the GSD
-        res.loc[idx, "GSD"] = self._gsd(tmp)
-
-        # delete the cpy to free up memory
-        del cpy, tmp
+            am, gm, mode = am * rho, gm * rho, mode * rho
 
-        return res
+        # build the results in one go
+        res = np.column_stack([
+            sums[:, 0], sums[:, 1], sums[:, 2], sums[:, 2] * rho, 
+            am, gm, mode, gsd
+        ])
+        res[empty] = np.nan
+
+        return pd.DataFrame(
+            res, 
+            index=self.data.index, 
+            columns=[
+                "number", "surface_area", "volume", "mass", 
+                "AM", "GM", "Mode", "GSD"
+            ]
+        )
 
     def integrate(self, weight='number', dmin=0., dmax=1., **kwargs):
         """
@@ -556,60 +757,60 @@ class GenericParticleSizer(object):
             
         # If kappa is not set, compute the integrated values and return
         if not _kappa:
-            if weight == 'number':
-                df = self.dn
-            elif weight == 'surface':
-                df = self.ds
-            elif weight == 'volume':
-                df = self.dv
-            else:
-                df = self.dv * [_rho(dp) for dp in self.midpoints]
-            
-            # Subsample the data and return
-            df = self._subselect_frame(df, dmin=dmin, dmax=dmax)
-            
-            return df[self.bin_labels].sum(axis=1)
-             
-        def compute_integration_by_row(row, weight):
-            # Recompute the bins
-            _bins = self.bins.copy()
-            
-            # Get rh
-            rh = row[rh_c]
+            # Build the per-bin weights to convert dN/dlogDp to the 
+            # chosen moment, including the partial bin factors
+            w = self.dlogdp * self._subselect_factors(dmin=dmin, dmax=dmax)
             
-            # Compute kappa for each (wet) diameter
-            k = [_kappa(dp) for dp in _bins[:, 1]]
-            
-            for i in range(_bins.shape[0]):
-                for j in range(3):
-                    _bins[i, j] = _bins[i, j] / (1 + k[i] * (rh / (100. - rh)))**(1./3.)
-                    
-            # Extract the midpoints
-            midpoints = _bins[:, 1]
-            
-            # Keep only the data for the bins that are relevant for this record
-            histogram = row[self.bin_labels] * self._subselect_bins(dmin=dmin, dmax=dmax, bins=_bins)
-            
-            # Return the histogram depending on which weight we're using
             if weight == 'surface':
-                hgram = histogram.mul((4 * np.pi * (_bins[:, 1]/2)**2))
+                w = w * self.s_multiplier
             elif weight == 'volume':
-                hgram = histogram.mul((4./3)*np.pi*(_bins[:, 1]/2)**3)
+                w = w * self.v_multiplier
             elif weight == 'mass':
-                hgram = histogram.mul((4./3)*np.pi*(_bins[:, 1]/2)**3).mul([_rho(dp) for dp in _bins[:, 1]])
+                w = w * self.v_multiplier * [_rho(dp) for dp in self.midpoints]
+            
+            return pd.Series(
+                self._weighted_row_sums(self._histogram_array(), w), 
+                index=self.data.index
+            )
+             
+        # Compute kappa for each (wet) diameter
+        k = np.array([_kappa(dp) for dp in self.midpoints], dtype=np.float64)
+
+        # Get rh as a column so that it broadcasts across the bins
+        rh = self.data[rh_c].to_numpy(dtype=np.float64)[:, None]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Recompute the (dry) bins for every record at once
+            growth = (1 + k * (rh / (100. - rh)))**(1./3.)
+
+            left = self.bins[:, 0] / growth
+            right = self.bins[:, -1] / growth
+            midpoints = self.bins[:, 1] / growth
+
+            # Keep only the data for the bins that are relevant for each record
+            histogram = (
+                self._histogram_array() * self.dlogdp 
+                * _bin_factors(left, right, dmin, dmax)
+            )
+
+        # Weight the histogram depending on which weight we're using
+        if weight == 'surface':
+            histogram *= 4 * np.pi * (midpoints/2)**2
+        elif weight in ('volume', 'mass'):
+            histogram *= (4./3)*np.pi*(midpoints/2)**3
+
+        if weight == 'mass':
+            if callable(rho):
+                # evaluate the density once per distinct dry diameter 
+                # rather than once per record and bin
+                dps, inverse = np.unique(midpoints, return_inverse=True)
+                densities = np.array([_rho(dp) for dp in dps], dtype=np.float64)
+
+                histogram *= densities[inverse].reshape(midpoints.shape)
             else:
-                hgram = histogram
-                
-            return hgram.sum()
-        
-        # Create a dataframe that is dn + humidity so that we are always sending the correct 
-        # format to the integration computation 
-        cpy = self.dn
-        cpy.loc[:, rh_c] = self.data[rh_c]
-        
-        s = cpy.apply(compute_integration_by_row, axis=1, weight=weight)
-        
-        return s
+                histogram *= rho
+
+        return pd.Series(np.nansum(histogram, axis=1), index=self.data.index)
 
     def slice(self, start=None, end=None, inplace=False):
         """
@@ -638,11 +839,7 @@ class GenericParticleSizer(object):
         if inplace:
             self.data = self.data[start:end]
         else:
-            cpy = self.copy()
-
-            cpy.data = cpy.data[start:end]
-
-            return cpy
+            return self._copy_with_data(self.data[start:end].copy())
         return
 
     def resample(self, rs, inplace=False):
@@ -670,71 +867,49 @@ class GenericParticleSizer(object):
         >>> obj.resample('1h', inplace=True)
 
         """
-        obj_cols = (
-            self
-            .data
-            .select_dtypes(include=['object'])
-            .resample(rs)
-            .first()
-        )
-        num_cols = (
-            self
-            .data
-            .select_dtypes(exclude=['object'])
-            .resample(rs)
-            .mean()
-        )
+        obj_cols = self.data.select_dtypes(include=['object']).columns
+        num_cols = self.data.columns.difference(obj_cols, sort=False)
 
-        # re-merge the two dataframes
-        merged = pd.merge(num_cols, obj_cols, left_index=True, 
-                          right_index=True, how='outer')
+        # aggregate both groups from a single resampler and restore 
+        # the original column order
+        resampler = self.data.resample(rs)
+        merged = pd.concat(
+            [resampler[num_cols].mean(), resampler[obj_cols].first()], 
+            axis=1
+        )[self.data.columns]
 
         if inplace:
             self.data = merged
         else:
-            cpy = self.copy()
-            cpy.data = merged
-
-            return cpy
+            return self._copy_with_data(merged)
 
         return
 
-    def _gsd(self, df):
+    def _gsd(self, arr, gm):
         """
         Private function to calculate the geometric 
         standard deviation for a lognormal distribution.
         
-        :param df: A DataFrame with a `GM` column holding 
-            the geometric mean and columns of bins. 
-            In each row the bin value will act as the 
-            weight on the midpoint value for that bin, 
-            found in `self.midpoints`. 
-        :type df: DataFrame
-        :return: A column holding the geometric mean for each row.
-        :rtype: Pandas Series
-        """
-
-        # calculate the GM in units of microns
-        gm = df['GM'] * 1e-3
-
-        # drop GM. At this point, the row will have the 
-        # histogram and nothing else
-        df = df.drop("GM", axis=1)
-
-        # calculate the geometric standard deviation
-        gsd = np.exp(
-            np.sqrt(
-                df
-                 .mul(
-                     (df*0)
-                     .add(np.log(self.midpoints), axis=1)
-                     .sub(np.log(gm), axis=0)
-                     **2
-                 )
-                 .sum(axis=1)
-                / (df.sum(axis=1))
+        :param arr: An array of bins where, in each row, 
+            the bin value will act as the weight on the 
+            midpoint value for that bin, found in 
+            `self.midpoints`. NaNs are ignored.
+        :type arr: numpy array
+        :param gm: The geometric mean for each row in microns.
+        :type gm: numpy array
+        :return: The geometric standard deviation for each row.
+        :rtype: numpy array
+        """
+        # squared log-distance of each midpoint from the GM
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dist = (self._log_midpoints[None, :] - np.log(gm)[:, None])**2
+
+            # calculate the geometric standard deviation
+            gsd = np.exp(
+                np.sqrt(
+                    np.nansum(arr * dist, axis=1) / np.nansum(arr, axis=1)
+                )
             )
-        )
 
         return gsd
 
@@ -763,14 +938,11 @@ class AlphasenseOPCN2(GenericParticleSizer):
     
     """
     def __init__(self, **kwargs):
-        bb = np.array([0.38, 0.54, 0.78, 1.05, 1.34, 1.59, 2.07, 3., 
-                       4., 5., 6.5, 8., 10., 12., 14., 16., 17.5])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _OPCN2_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(AlphasenseOPCN2, self).__init__(
@@ -792,15 +964,11 @@ class AlphasenseOPCN3(GenericParticleSizer):
     alphasense.com/products/optical-particle-counter/>`__.
     """
     def __init__(self, **kwargs):
-        bb = np.array([0.35, 0.46, 0.66, 1., 1.3, 1.7, 2.3, 3.,
-                            4., 5.2, 6.5, 8., 10., 12., 14., 16., 18.,
-                            20., 22., 25., 28., 31., 34., 37., 40.])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _OPCN3_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(AlphasenseOPCN3, self).__init__(
@@ -822,15 +990,11 @@ class ModulairPM(GenericParticleSizer):
     `here <https://www.alphasense.com/products/optical-particle-counter/>`__.
     """
     def __init__(self, **kwargs):
-        bb = np.array([0.35, 0.46, 0.66, 1., 1.3, 1.7, 2.3, 3.,
-                            4., 5.2, 6.5, 8., 10., 12., 14., 16., 18.,
-                            20., 22., 25., 28., 31., 34., 37., 40.])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _OPCN3_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(ModulairPM, self).__init__(
@@ -855,15 +1019,11 @@ class Modulair(GenericParticleSizer):
     `here <https://www.alphasense.com/products/optical-particle-counter/>`__.
     """
     def __init__(self, **kwargs):
-        bb = np.array([0.35, 0.46, 0.66, 1., 1.3, 1.7, 2.3, 3.,
-                            4., 5.2, 6.5, 8., 10., 12., 14., 16., 18.,
-                            20., 22.,])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _MODULAIR_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(Modulair, self).__init__(
@@ -885,16 +1045,12 @@ class POPS(GenericParticleSizer):
     <http://www.handixscientific.com/pops>`__.
     """
     def __init__(self, **kwargs):
-        # default left and right bounds according to Handix
-        bb = 1e-3*np.array([132, 144, 158, 174, 191, 209, 229, 270, 324, 
-                            473, 594, 1009, 1294, 1637, 2148, 2864, 3648])
-
-        # make the 3xn array of bins using the utility 
-        # function make_bins()
-        bins = kwargs.pop('bins', make_bins(boundaries=bb))
-
-        #
+        bins = kwargs.pop("bins", _POPS_BINS)
         fmt = kwargs.pop("fmt", "dn")
+        bin_labels = kwargs.pop(
+            "bin_labels", 
+            _make_bin_labels(bins.shape[0])
+        )
 
         super(POPS, self).__init__(
             bins=bins, 
@@ -914,13 +1070,11 @@ class ParticlesPlus(GenericParticleSizer):
     <https://particlesplus.com/ambient-air-monitoring/>`__.
     """
     def __init__(self, **kwargs):
-        bb = np.array([0.3, 0.5, 0.7, 1., 2.5, 10.0, 10.1])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _PARTICLES_PLUS_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(ParticlesPlus, self).__init__(
@@ -942,17 +1096,11 @@ class Grimm11D(GenericParticleSizer):
     dust-decoder/11-d/>`__.
     """
     def __init__(self, **kwargs):
-        bb = np.array([
-            0.25, 0.28, 0.3, 0.35, 0.4, 0.45, 0.5, 0.58, 0.65, 0.7, 
-            0.8, 1.0, 1.3, 1.6, 2.0, 2.5, 3.0, 3.5, 4., 5., 6.5, 7.5, 
-            8.5, 10., 12.5, 15., 17.5, 20., 25., 30., 32., 35.
-        ])
-
-        bins = kwargs.pop("bins", make_bins(boundaries=bb))
+        bins = kwargs.pop("bins", _GRIMM11D_BINS)
         fmt = kwargs.pop("fmt", "dn")
         bin_labels = kwargs.pop(
             "bin_labels", 
-            ["bin{}".format(i) for i in range(bins.shape[0])]
+            _make_bin_labels(bins.shape[0])
         )
 
         super(Grimm11D, self).__init__(
@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 """
 """
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 from matplotlib.colors import LogNorm
 import matplotlib.ticker as mtick
 from matplotlib.ticker import ScalarFormatter
-import seaborn as sns
 from numpy import nan_to_num
 
 default_cmap = 'viridis'
@@ -45,15 +46,44 @@ def heatmap(X, Y, Z, ax=None, logy=True, cbar=True, hide_low=True,
     fig_kws : dict, default=None
         Optional kwargs to pass to the Figure.
     cbar_kws : dict, default=None
-        Optional kwargs to be passed to the colorbar.
+        Optional kwargs to be passed to the colorbar. To draw the 
+        colorbar into an existing axis (e.g., to reuse it across 
+        repeated calls) rather than taking space from the plot, 
+        pass it as `cbar_kws={'cax': cax}`.
     plot_kws : dict, default=None
         Optional kwargs to be passed to pcolormesh.
     cbar_min : float
         The minimum value to use for the colorbar. Defaults to 
-        the greater of 1 or the lowest Z value.
+        the vmin of `norm` if set, otherwise the greater of 1 or 
+        the lowest Z value.
     cbar_max : float
         The maximum value to use for the colobar. Defaults to the 
-        largest value in Z.
+        vmax of `norm` if set, otherwise the largest value in Z.
+    norm : matplotlib.colors.Normalize, default=None
+        The normalization to use for the colors, which can be reused 
+        across calls. If None, a LogNorm between cbar_min and 
+        cbar_max is created.
+    use_imshow : bool, default=False
+        If true, draw the data as an image with `imshow` rather than 
+        with `pcolormesh`, which is much faster for large datasets but 
+        requires 1D X and Y (in log-space if `logy`) that are evenly 
+        spaced. Note that with `logy`, the image is drawn in log10 
+        units on a linear axis, so any further plotting on the axis 
+        must use log10(Dp) as well. Falls back to `pcolormesh` if X 
+        and Y are not 1D and evenly spaced.
+    rasterized : bool, default=True
+        If true, the data is rasterized when saving to a vector format 
+        (e.g., pdf or svg) while the axes and labels remain vector 
+        graphics. This keeps file sizes small for large datasets.
+    precision : str or None, default='float32'
+        The dtype to cast double precision Z to before drawing, which 
+        halves the memory matplotlib has to normalize and color. If 
+        None, Z is drawn as given.
+    max_cells : int or tuple of ints, default=None
+        The maximum number of cells to draw along the (y, x) axes. If 
+        Z is larger, it is coarsened by averaging blocks of adjacent 
+        cells before plotting. A single int applies to both axes. 
+        If None, Z is drawn at full resolution.
     
     Returns
     -------
@@ -68,65 +98,215 @@ def heatmap(X, Y, Z, ax=None, logy=True, cbar=True, hide_low=True,
     >>> ax = smps.plots.heatmap(X, Y, Z, cmap='viridis')
 
     """
-    # Copy to avoid modifying original data
-    Z_plot = Z.copy()
-
-    # get rid of NaNs
-    Z_plot = nan_to_num(Z_plot)
-
-    # Set the colorbar min and max based on the min and 
-    # max of the values
-    cbar_min = kwargs.pop(
-        'cbar_min', 
-        Z_plot.min() if Z_plot.min() > 0.0 else 1.
-    )
-    cbar_max = kwargs.pop('cbar_max', Z_plot.max())
+    # Work with the underlying arrays so matplotlib never sees 
+    # pandas objects
+    X, Y = _to_numpy(X), _to_numpy(Y)
+
+    Z_plot = _to_numpy(Z)
+
+    # Draw double precision data in reduced precision, which is plenty 
+    # for colors; the cast makes a new array that is safe to modify
+    precision = kwargs.pop('precision', 'float32')
+    is_copy = False
+    if not np.issubdtype(Z_plot.dtype, np.floating):
+        # integer data (e.g., raw counts) must be floats to be clipped
+        Z_plot, is_copy = Z_plot.astype(precision or float), True
+    elif precision is not None and Z_plot.dtype == np.float64:
+        Z_plot, is_copy = Z_plot.astype(precision), True
+
+    # Get rid of NaNs, only copying the data when it needs to be 
+    # modified to avoid changing the original data
+    if hide_low or not np.isfinite(Z_plot).all():
+        Z_plot = nan_to_num(Z_plot, copy=not is_copy)
+
+    norm = kwargs.pop('norm', None)
+
+    # Set the colorbar min and max based on the norm or the min and 
+    # max of the values, only computing them if needed
+    if 'cbar_min' in kwargs:
+        cbar_min = kwargs.pop('cbar_min')
+    elif norm is not None and norm.vmin is not None:
+        cbar_min = norm.vmin
+    else:
+        zmin = Z_plot.min()
+        cbar_min = zmin if zmin > 0.0 else 1.
+
+    if 'cbar_max' in kwargs:
+        cbar_max = kwargs.pop('cbar_max')
+    elif norm is not None and norm.vmax is not None:
+        cbar_max = norm.vmax
+    else:
+        cbar_max = Z_plot.max()
+
+    if norm is None:
+        norm = LogNorm(vmin=cbar_min, vmax=cbar_max)
 
     if hide_low:
-        # Increase values below cbar_min to cbar_min
-        below_min = Z_plot < cbar_min
-        Z_plot[below_min] = cbar_min
+        # Increase values below cbar_min to cbar_min in place
+        np.maximum(Z_plot, cbar_min, out=Z_plot)
+
+    # Coarsen the data if it has more cells than are worth drawing
+    max_cells = kwargs.pop('max_cells', None)
+    if max_cells is not None:
+        X, Y, Z_plot = _block_reduce(X, Y, Z_plot, max_cells)
+
+    # Only draw the data as an image if asked to and the grid allows it
+    use_imshow = (
+        kwargs.pop('use_imshow', False) 
+        and np.ndim(X) == np.ndim(Y) == 1
+        and _is_uniform(_as_numeric(X)) 
+        and _is_uniform(np.log10(Y) if logy else Y)
+    )
 
     # Set the plot_kws
-    plot_kws = dict(
-        dict(norm=LogNorm(vmin=cbar_min, vmax=cbar_max), cmap=cmap), 
+    plot_kws = {
+        "norm": norm, 
+        "cmap": cmap, 
+        "rasterized": kwargs.pop('rasterized', True), 
         **plot_kws
-    )
+    }
 
     # Set the figure keywords
-    fig_kws = dict(dict(figsize=(10,5)), **fig_kws)
+    fig_kws = {"figsize": (10,5), **fig_kws}
 
     if ax is None:
         plt.figure(**fig_kws)
         ax = plt.gca()
 
-    # Plot the data as a pcolormesh
-    im = ax.pcolormesh(X, Y, Z_plot, shading='auto', **plot_kws)
+    if use_imshow:
+        im = _imshow(ax, X, Y, Z_plot, logy=logy, **plot_kws)
+    else:
+        # Set the axis to be log in the y-axis before plotting so 
+        # the mesh isn't transformed twice
+        if logy:
+            ax.set_yscale('log')
 
-    # Set the ylim to match the data
-    ax.set_ylim([Y.min(), Y.max()])
+            ax.yaxis.set_major_formatter(ScalarFormatter())
 
-    # Set the axis to be log in the y-axis
-    if logy:
-        ax.semilogy()
+        # Set the ylim to match the data
+        ax.set_ylim([Y.min(), Y.max()])
 
-        ax.yaxis.set_major_formatter(ScalarFormatter())
+        # Plot the data as a pcolormesh
+        im = ax.pcolormesh(X, Y, Z_plot, shading='auto', **plot_kws)
 
     ax.set_ylabel(r"$D_p\;[\mu m]$")
 
     if cbar:
         # Set the figure keywords
-        cbar_kws = dict(
-            dict(label=r'$dN/dlogD_p\;[cm^{-3}]$'), 
-            **cbar_kws
-        )
+        cbar_kws = {"label": r'$dN/dlogD_p\;[cm^{-3}]$', **cbar_kws}
 
         clb = plt.colorbar(im, **cbar_kws)
 
     return ax
 
 
-def histplot(histogram, bins, ax=None, plot_kws=None, fig_kws=None, **kwargs):
+def _block_reduce(X, Y, Z, max_cells):
+    """
+    Average Z over blocks of adjacent cells so that it has at most 
+    max_cells cells along each axis, keeping the first X and Y value 
+    of each block. X and Y may be 1-D or 2-D (meshgrid) coordinates. 
+    Cells left over at the end of an axis are dropped.
+    """
+    ny, nx = (max_cells, max_cells) if np.isscalar(max_cells) else max_cells
+
+    sy = max(1, -(-Z.shape[0] // ny)) if ny else 1
+    sx = max(1, -(-Z.shape[1] // nx)) if nx else 1
+
+    if sy == 1 and sx == 1:
+        return X, Y, Z
+
+    ry, rx = Z.shape[0] // sy, Z.shape[1] // sx
+
+    Z = Z[:ry*sy, :rx*sx].reshape(ry, sy, rx, sx).mean(axis=(1, 3))
+
+    X, Y = np.asarray(X), np.asarray(Y)
+
+    # Meshgrid coordinates are reduced along both axes
+    if X.ndim == 2:
+        X = X[:ry*sy:sy, :rx*sx:sx]
+    else:
+        X = X[:rx*sx:sx]
+
+    if Y.ndim == 2:
+        Y = Y[:ry*sy:sy, :rx*sx:sx]
+    else:
+        Y = Y[:ry*sy:sy]
+
+    return X, Y, Z
+
+
+def _to_numpy(arr):
+    """
+    Return the array underlying a pandas object without copying it.
+    """
+    if hasattr(arr, "to_numpy"):
+        return arr.to_numpy(copy=False)
+
+    return np.asarray(arr)
+
+
+def _as_numeric(X):
+    """
+    Return X as an array of floats, converting datetimes to 
+    matplotlib date numbers.
+    """
+    X = np.asarray(X)
+    if not np.issubdtype(X.dtype, np.number):
+        return mdates.date2num(X)
+
+    return X.astype(float)
+
+
+def _is_uniform(x):
+    """
+    Return True if the values in x are evenly spaced.
+    """
+    dx = np.diff(np.asarray(x, dtype=float))
+
+    # a small tolerance allows for rounded timestamps and diameters
+    return dx.size > 0 and np.allclose(dx, dx[0], rtol=1e-2, atol=0.)
+
+
+def _imshow(ax, X, Y, Z, logy=True, **kwargs):
+    """
+    Draw a heatmap on an evenly spaced grid as an image. If logy, 
+    the image is drawn in log10-space and the ticks are labeled 
+    with the diameters they represent.
+    """
+    x = _as_numeric(X)
+    y = np.log10(Y) if logy else np.asarray(Y, dtype=float)
+
+    # pad the extent by half a cell so that the cells are centered 
+    # on X and Y, matching pcolormesh(shading='auto')
+    dx, dy = x[1] - x[0], y[1] - y[0]
+
+    im = ax.imshow(
+        Z, origin='lower', aspect='auto', interpolation='nearest',
+        extent=[x[0] - dx/2, x[-1] + dx/2, y[0] - dy/2, y[-1] + dy/2], 
+        **kwargs
+    )
+
+    if not np.issubdtype(np.asarray(X).dtype, np.number):
+        ax.xaxis_date()
+
+    # Set the ylim to match the data
+    ymin, ymax = y.min(), y.max()
+    ax.set_ylim([ymin, ymax])
+
+    if logy:
+        # place ticks at 1, 2, and 5 times each decade
+        decades = 10. ** np.arange(np.floor(ymin), np.ceil(ymax) + 1)
+        ticks = np.log10(np.outer(decades, [1., 2., 5.]).ravel())
+
+        ax.yaxis.set_major_locator(mtick.FixedLocator(ticks))
+        ax.yaxis.set_major_formatter(
+            mtick.FuncFormatter(lambda v, pos: "{:g}".format(10**v)))
+
+    return im
+
+
+def histplot(histogram, bins, ax=None, plot_kws=None, fig_kws=None, 
+             kind='bar', **kwargs):
     """
     Plot the particle size distribution at a single point in time.
     
@@ -149,6 +329,11 @@ def histplot(histogram, bins, ax=None, plot_kws=None, fig_kws=None, **kwargs):
         Optional kwargs passed to the `matplotlib.figure.figure` object. See 
         `here <https://matplotlib.org/stable/api/_as_gen
         /matplotlib.pyplot.figure.html>`__ for more info.
+    kind : str, default='bar'
+        How to draw the distribution; one of ['bar', 'stairs']. 'stairs' 
+        draws the outline of adjacent bins as a single filled patch using 
+        `matplotlib.pyplot.stairs`, which is much faster and lighter than 
+        one rectangle per bin, but assumes there are no gaps between bins.
     
     Returns
     -------
@@ -161,9 +346,19 @@ def histplot(histogram, bins, ax=None, plot_kws=None, fig_kws=None, **kwargs):
     
     >>> ax = smps.plots.histplot(obj.dndlogdp, obj.bins)
     
+    Draw the same distribution as a single filled outline:
+    
+    >>> ax = smps.plots.histplot(obj.dndlogdp, obj.bins, kind='stairs')
+    
     """
+    assert(kind in ["bar", "stairs"]), "Invalid option chosen for kind"
+
     if isinstance(histogram, pd.DataFrame):
-        histogram = histogram.mean().values
+        histogram = histogram.mean().to_numpy()
+
+    # hand matplotlib contiguous float arrays only
+    histogram = np.ascontiguousarray(_to_numpy(histogram), dtype=float)
+    bins = np.ascontiguousarray(bins, dtype=float)
 
     if fig_kws is None:
         fig_kws = dict(figsize=(16,8))
@@ -175,8 +370,18 @@ def histplot(histogram, bins, ax=None, plot_kws=None, fig_kws=None, **kwargs):
         plt.figure(**fig_kws)
         ax = plt.gca()
 
-    ax.bar(x=bins[:, 0], height=histogram, width=bins[:, -1] - bins[:, 0],
-            align='edge', **plot_kws)
+    if kind == 'stairs':
+        # the edges are the left boundaries plus the last right boundary
+        edges = np.empty(bins.shape[0] + 1)
+        edges[:-1] = bins[:, 0]
+        edges[-1] = bins[-1, -1]
+
+        ax.stairs(histogram, edges, **{"fill": True, **plot_kws})
+    else:
+        left = bins[:, 0]
+        width = bins[:, -1] - left
+
+        ax.bar(left, histogram, width, align='edge', **plot_kws)
 
     ax.semilogx()
 
@@ -4,15 +4,16 @@ import matplotlib as mpl
 
 __all__ = ["set"]
 
-def set(tick_scale=1, rc=dict()):
+def set(tick_scale=1, rc=None):
     """
-    Control plot style and scaling using seaborn and the 
-    matplotlib rcParams interface.
+    Control plot style and scaling using the matplotlib 
+    rcParams interface.
     
     :param tick_scale: A scaler number controling the spacing 
         on tick marks, defaults to 1.
     :type tick_scale: float
-    :param rc: Additional settings to pass to rcParams.
+    :param rc: Additional settings to pass to rcParams, defaults 
+        to None.
     :type rc: dict
     """
     rc_log_defaults = {
@@ -26,4 +27,7 @@ def set(tick_scale=1, rc=dict()):
         'mathtext.default': 'regular'
     }
 
-    mpl.rcParams.update(dict(rc_log_defaults, **rc))
+    if rc:
+        rc_log_defaults.update(rc)
+
+    mpl.rcParams.update(rc_log_defaults)
@@ -3,11 +3,16 @@
 """
 """
 import numpy as np
-import requests
-import math
-from scipy.stats.mstats import gmean
-
-def make_bins(**kwargs):
+import pandas as pd
+import urllib.request
+import mmap
+import os
+import tempfile
+import hashlib
+
+def make_bins(*, boundaries=None, boundaries_left=None, boundaries_right=None, 
+              lb=None, ub=None, midpoints=None, channels_per_decade=64, 
+              mean_calc="am"):
     """
     Create a 3xn array of particle size bins.
     
@@ -28,9 +33,9 @@ def make_bins(**kwargs):
         The upper bound of the largest size bin. If used, you must also provide a value for lb.
     midpoints : array-like
         A list of midpoints to use. If used, you must also provide values for lb and ub.
-    channels_per_decade : int
+    channels_per_decade : int, default=64
         A measure of the bin width on a log scale.
-    mean_calc : str
+    mean_calc : str, default='am'
         The method of calculation for midpoints. Should be one of ('am', 'gm') corresponding 
         to the arithmetic or geometric mean.
     
@@ -59,14 +64,7 @@ def make_bins(**kwargs):
     >>> bins = make_bins(lb=0.35, ub=10.0, midpoints=np.array([.5, 2.0, 5.0]))
     
     """
-    boundaries = kwargs.pop("boundaries", None)
-    boundaries_left = kwargs.pop("boundaries_left", None)
-    boundaries_right = kwargs.pop("boundaries_right", None)
-    lb = kwargs.pop("lb", None)
-    ub = kwargs.pop("ub", None)
-    midpoints = kwargs.pop("midpoints", None)
-    cpd = kwargs.pop("channels_per_decade", 64)
-    mean_calc = kwargs.pop("mean_calc", "am")
+    cpd = channels_per_decade
 
     # initialize bins
     bins = None
@@ -75,8 +73,8 @@ def make_bins(**kwargs):
         if lb is None or ub is None:
             raise Exception("A lower and upper bound must be set")
 
+        # every cell is filled below, so there's no need to initialize
         bins = np.empty((midpoints.shape[0], 3))
-        bins.fill(np.NaN)
 
         # fill the midpoints
         bins[:, 1] = midpoints
@@ -85,22 +83,26 @@ def make_bins(**kwargs):
         bins[0, 0] = lb
         bins[-1, -1] = ub
 
-        # iterate and calculate the bounds
-        for i in range(bins.shape[0] - 1):
-            bins[i, 2] = round(
-                math.pow(10, np.log10(bins[i, 0]) + 1./cpd), 
-                4
-            )
-            bins[i+1, 0] = bins[i, 2]
+        # calculate the bounds; each boundary is rounded before the 
+        # next is computed from it, so this can't be a single array 
+        # operation. Iterate on python floats to avoid numpy scalar 
+        # overhead and assign the results in one go. np.log10 is kept 
+        # over math.log10, which can differ in the last bit and change 
+        # the rounded bounds
+        inv_cpd = 1. / cpd
+        bounds = [float(lb)]
+        for _ in range(bins.shape[0] - 1):
+            bounds.append(round(10. ** (np.log10(bounds[-1]) + inv_cpd), 4))
+
+        bins[1:, 0] = bounds[1:]
+        bins[:-1, 2] = bounds[1:]
 
         return bins
 
     if boundaries is not None:
-        bins = np.empty((boundaries.shape[0]-1, 3))
-        bins.fill(np.NaN)
+        boundaries = np.asarray(boundaries, dtype=float)
 
-        bins[:, 0] = boundaries[0:-1]
-        bins[:, 2] = boundaries[1:]
+        left, right = boundaries[:-1], boundaries[1:]
 
     elif boundaries_left is not None:
         if boundaries_right is None:
@@ -109,11 +111,8 @@ def make_bins(**kwargs):
         assert(boundaries_left.shape[0] == boundaries_right.shape[0]), \
             "Boundaries must be the same dimensions."
 
-        bins = np.empty((boundaries_left.shape[0], 3))
-        bins.fill(np.NaN)
-
-        bins[:, 0] = boundaries_left
-        bins[:, 2] = boundaries_right
+        left = np.asarray(boundaries_left, dtype=float)
+        right = np.asarray(boundaries_right, dtype=float)
 
     else:
         raise Exception("Not enough information to compute.")
@@ -122,19 +121,126 @@ def make_bins(**kwargs):
     assert(mean_calc in ("gm", "am")), "Invalid mean calculation method."
 
     if mean_calc == 'am':
-        bins[:, 1] = (bins[:, 0] + bins[:, 2]) / 2
+        mid = (left + right) / 2
     else:
-        bins[:, 1] = [gmean([x, y]) for x, y in zip(bins[:, 0], bins[:, 2])]
+        # the geometric mean of two values is the root of their product
+        mid = np.sqrt(left * right)
+
+    # build the bins in one go
+    bins = np.column_stack([left, mid, right])
 
     return bins
 
+# bin labels are shared by every file/model, so only format them once
+_BIN_LABELS = ["bin{}".format(i) for i in range(512)]
+
+def _make_bin_labels(n):
+    """
+    Return the default labels for `n` bins (i.e., bin0, bin1, ...).
+    
+    :param n: The number of bins.
+    :type n: int
+    :return: A new list of bin labels.
+    :rtype: list
+    """
+    if n <= len(_BIN_LABELS):
+        return _BIN_LABELS[:n]
+
+    return ["bin{}".format(i) for i in range(n)]
+
+def _is_url(fpath):
+    """
+    Return True if `fpath` is an http(s) url rather than a file path.
+    
+    :param fpath: A path or url for a file.
+    :type fpath: string
+    :rtype: bool
+    """
+    return str(fpath).startswith(('http://', 'https://'))
+
+def _download(url, data_home=None):
+    """
+    Download a file into a local cache directory, unless it is 
+    already there, and return its path.
+    
+    :param url: The url of the file.
+    :type url: string
+    :param data_home: The directory to cache files in, defaults to 
+        the `SMPS_DATA` environment variable or `~/.cache/py-smps`.
+    :type data_home: string
+    :return: The path to the local copy of the file.
+    :rtype: string
+    """
+    if data_home is None:
+        data_home = os.environ.get(
+            "SMPS_DATA", 
+            os.path.join(os.path.expanduser("~"), ".cache", "py-smps")
+        )
+
+    os.makedirs(data_home, exist_ok=True)
+
+    # prefix the filename with a hash of the url so that files with 
+    # the same name at different urls don't collide
+    fpath = os.path.join(data_home, "{}-{}".format(
+        hashlib.sha1(url.encode()).hexdigest()[:12], os.path.basename(url)))
+
+    if not os.path.exists(fpath):
+        # download to a temporary file first so that an interrupted 
+        # download never leaves a partial file in the cache
+        fd, tmp = tempfile.mkstemp(dir=data_home)
+        try:
+            with os.fdopen(fd, 'wb') as f, urllib.request.urlopen(url) as resp:
+                f.write(resp.read())
+
+            os.replace(tmp, fpath)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    return fpath
+
+def _read_first_items(fpath, delimiter=',', encoding='ISO-8859-1'):
+    """
+    Read a file in one go and return the first item of every line.
+    
+    :param fpath: A path or url for the file (urls must start with 
+        `http://` or `https://`).
+    :type fpath: string
+    :param delimiter: The delimiter between items in the file, 
+        defaults to ','.
+    :type delimiter: string
+    :param encoding: The encoding for the file, defaults to 
+        'ISO-8859-1'.
+    :type encoding: string
+    :return: The first item of each line in the file.
+    :rtype: pandas.Series
+    """
+    if _is_url(fpath):
+        with urllib.request.urlopen(fpath) as resp:
+            content = resp.read()
+
+        # normalize the line endings the same way reading a local file does
+        text = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        text = text.decode(encoding)
+    else:
+        with open(fpath, 'r', encoding=encoding) as f:
+            text = f.read()
+
+    lines = text.split('\n')
+
+    # a trailing newline does not start a new line
+    if lines[-1] == '':
+        lines.pop()
+
+    return pd.Series(lines, dtype=object).str.split(delimiter, n=1).str[0]
+
 def _get_bin_count(fpath, delimiter=',', encoding='ISO-8859-1'):
     """
-    Gets the number of bins in the file.
+    Gets the number of bins in the file, i.e., the number of lines 
+    whose first item is a non-zero number.
     
-    :param fpath: A path or url for the file (if a url it must 
-        include `http`, and if a file path it must not contain 
-        `http`).
+    :param fpath: A path or url for the file (urls must start with 
+        `http://` or `https://`).
     :type fpath: string
     :param delimiter: The delimiter between items in the file, 
         defaults to ','.
@@ -145,24 +251,9 @@ def _get_bin_count(fpath, delimiter=',', encoding='ISO-8859-1'):
     :return: The number of bins in the file.
     :rtype: int
     """
-    bins = 0
-    if 'http' in fpath:
-        req = requests.get(fpath)
-
-        for line in req.iter_lines():
-            try:
-                if float(line.decode(encoding).split(delimiter)[0]):
-                    bins += 1
-            except: pass
-    else:
-        with open(fpath, 'r', encoding=encoding) as f:
-            for line in f:
-                try:
-                    if float(line.split(delimiter)[0]):
-                        bins += 1
-                except: pass
+    items = _read_first_items(fpath, delimiter=delimiter, encoding=encoding)
 
-    return bins
+    return _count_bins(items)
 
 def _get_linecount(fpath, keyword, delimiter=',', encoding='ISO-8859-1'):
     """
@@ -170,9 +261,8 @@ def _get_linecount(fpath, keyword, delimiter=',', encoding='ISO-8859-1'):
     `keyword`. If there is no such line, it will return the total 
     number of lines in the file.
     
-    :param fpath: A path or url for the file (if a url it must 
-        include `http`, and if a file path it must not 
-        contain `http`).
+    :param fpath: A path or url for the file (urls must start with 
+        `http://` or `https://`).
     :type fpath: string
     :param keyword: The string to look for.
     :type keyword: string
@@ -186,29 +276,138 @@ def _get_linecount(fpath, keyword, delimiter=',', encoding='ISO-8859-1'):
         `keyword`.
     :rtype: int
     """
-    linecount = 0
+    if _is_url(fpath):
+        # stream the response so the download stops once the line is 
+        # found, comparing raw bytes to avoid decoding every line
+        kw, delim = keyword.encode(encoding), delimiter.encode(encoding)
+
+        linecount = 0
+        with urllib.request.urlopen(fpath) as resp:
+            for line in resp:
+                if line.rstrip(b'\r\n').partition(delim)[0] == kw:
+                    break
 
-    if 'http' in fpath:
-        req = requests.get(fpath)
+                linecount += 1
 
-        for line in req.iter_lines():
-            startswith = line.decode(encoding).split(delimiter)[0]
+        return linecount
 
-            if startswith == keyword:
-                break
+    # local files can usually be searched without decoding them
+    linecount = _scan_linecount(fpath, keyword, delimiter, encoding)
+    if linecount is not None:
+        return linecount
 
-            linecount += 1
-    else:
-        with open(fpath, 'r', encoding=encoding) as f:
-            for line in f:
-                startswith = line.split(delimiter)[0]
+    items = _read_first_items(fpath, delimiter=delimiter, encoding=encoding)
 
-                if startswith == keyword:
-                    break
+    return _find_line(items, keyword)
 
-                linecount += 1
+def _scan_file(fpath, keyword, delimiter=',', encoding='ISO-8859-1'):
+    """
+    Return both the line number where the first item is `keyword` 
+    (see `_get_linecount`) and the number of bins (see 
+    `_get_bin_count`) from a single read of the file.
+    
+    :param fpath: A path or url for the file (urls must start with 
+        `http://` or `https://`).
+    :type fpath: string
+    :param keyword: The string to look for.
+    :type keyword: string
+    :param delimiter: The delimiter between items in the file, 
+        defaults to ','.
+    :type delimiter: string
+    :param encoding: The encoding for the file, defaults to 
+        'ISO-8859-1'.
+    :type encoding: string
+    :return: The line number in the file where the first item is 
+        `keyword` and the number of bins in the file.
+    :rtype: tuple
+    """
+    items = _read_first_items(fpath, delimiter=delimiter, encoding=encoding)
+
+    return _find_line(items, keyword), _count_bins(items)
+
+def _count_bins(items):
+    """
+    Count the items that are non-zero numbers.
+    
+    :param items: The first item of each line in a file.
+    :type items: pandas.Series
+    :return: The number of bins.
+    :rtype: int
+    """
+    values = pd.to_numeric(items, errors='coerce')
+
+    return int((values.notna() & (values != 0)).sum())
+
+def _find_line(items, keyword):
+    """
+    Find the first item equal to `keyword`.
+    
+    :param items: The first item of each line in a file.
+    :type items: pandas.Series
+    :param keyword: The string to look for.
+    :type keyword: string
+    :return: The index of the first match, or the number of items 
+        if there is none.
+    :rtype: int
+    """
+    matches = np.flatnonzero(items.to_numpy() == keyword)
+
+    return int(matches[0]) if matches.size else len(items)
+
+def _scan_linecount(fpath, keyword, delimiter=',', encoding='ISO-8859-1'):
+    """
+    Return the line number in a local file where the first item is 
+    `keyword` by searching the raw bytes of the memory-mapped file. 
+    If the line cannot be found this way (e.g., the keyword is missing, 
+    the file is empty, or it uses an encoding or line endings that 
+    a byte search can't handle), it will return None.
+    
+    :param fpath: A path for the file.
+    :type fpath: string
+    :param keyword: The string to look for.
+    :type keyword: string
+    :param delimiter: The delimiter between items in the file, 
+        defaults to ','.
+    :type delimiter: string
+    :param encoding: The encoding for the file, defaults to 
+        'ISO-8859-1'.
+    :type encoding: string
+    :return: The line number in the file where the first item is 
+        `keyword`, or None.
+    :rtype: int
+    """
+    if '\n'.encode(encoding) != b'\n':
+        return None
+
+    kw = keyword.encode(encoding)
+
+    # the keyword must be followed by a delimiter or the end of the line
+    ends = (delimiter.encode(encoding), b'\r', b'\n', b'')
 
-    return linecount
+    with open(fpath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+
+    with mm:
+        start = 0
+        while True:
+            if mm[start:start+len(kw)] == kw \
+                and mm[start+len(kw):start+len(kw)+1] in ends:
+                head = mm[:start]
+
+                # old-style mac line endings would be miscounted
+                if head.count(b'\r') != head.count(b'\r\n'):
+                    return None
+
+                return head.count(b'\n')
+
+            pos = mm.find(b'\n' + kw, start)
+            if pos == -1:
+                return None
+
+            start = pos + 1
 
 def roundup(x):
     """
@@ -219,10 +418,13 @@ def roundup(x):
     :return: `x` rounded up to a multiple of 100.
     :rtype: float
     """
-    return x if x % 100 == 0 else x + 100 - x % 100
-
+    # ceiling division keeps ints as ints and also works on arrays
+    return -(-x // 100) * 100
 
 
+# formatters for the value (error) fields of a Table row
+_format_sci = "{:.2e} ({:.1e})".format
+_format_fixed = "{:.2f} ({:.1e})".format
 
 class Table(object):
     """
@@ -234,9 +436,17 @@ class Table(object):
     :type max_width: int
     """
     def __init__(self, max_width=80, **kwargs):
-        self.text = ""
+        self._parts = []
         self.max_width_chars = max_width
 
+        # the default width of each of the four columns
+        self._cell_width = int(max_width / 4)
+
+    @property
+    def text(self):
+        """The text of the table."""
+        return "".join(self._parts)
+
     def add_title(self, title):
         """
         Add a title to the top of the table.
@@ -244,7 +454,7 @@ class Table(object):
         :param title: The title to be added.
         :type title: string
         """
-        self.text = title.center(self.max_width_chars) + self.text
+        self._parts.insert(0, title.center(self.max_width_chars))
 
         return
 
@@ -257,7 +467,7 @@ class Table(object):
         :type char: string
         """
         assert(len(char)==1), "`char` must be a single character"
-        self.text += '\n' + char*self.max_width_chars
+        self._parts.append('\n' + char*self.max_width_chars)
 
         return
 
@@ -275,7 +485,7 @@ class Table(object):
         :rtype: string        
         """
         if width is None:
-            width = int(self.max_width_chars / 4)
+            width = self._cell_width
 
         return text.center(width)
 
@@ -284,30 +494,24 @@ class Table(object):
         Appends a header to the bottom of the table with four 
         sections: blank, "N (cm-3)", "GM (nm)", and "GSD".
         """
-        self.text += (
-            "\n" 
-            + self._center_text("") 
-            + self._center_text("N (cm-3)")
-        )
-        self.text += (
-            self._center_text("GM (nm)") 
-            + self._center_text("GSD")
-        )
+        self._parts.extend([
+            "\n", 
+            self._center_text(""), 
+            self._center_text("N (cm-3)"), 
+            self._center_text("GM (nm)"), 
+            self._center_text("GSD")
+        ])
 
         return
 
     def add_row(self, label, fields, errors):
-        self.text += "\n" + self._center_text(label)
-
-        field1 = "{:.2e} ({:.1e})".format(fields[0], errors[0])
-        field2 = "{:.2f} ({:.1e})".format(fields[1], errors[1])
-        field3 = "{:.2f} ({:.1e})".format(fields[2], errors[2])
-
-        self.text += (
-            self._center_text(field1) 
-            + self._center_text(field2) 
-            + self._center_text(field3)
-        )
+        self._parts.append("".join([
+            "\n", 
+            self._center_text(label), 
+            self._center_text(_format_sci(fields[0], errors[0])), 
+            self._center_text(_format_fixed(fields[1], errors[1])), 
+            self._center_text(_format_fixed(fields[2], errors[2]))
+        ]))
 
         return
 
@@ -0,0 +1,16 @@
+import os
+import functools
+import pytest
+from smps.utils import _download
+
+
+@pytest.fixture(scope="session")
+def datafile(pytestconfig):
+    """
+    Return a function that downloads a remote datafile only once and 
+    returns the path to the local copy. Copies are kept in the pytest 
+    cache (or in `SMPS_DATA` if set) so that later runs work offline.
+    """
+    data_home = os.environ.get("SMPS_DATA") or str(pytestconfig.cache.mkdir("py-smps"))
+
+    return functools.partial(_download, data_home=data_home)
@@ -1,4 +1,7 @@
 import smps
+import os
+import json
+import tempfile
 import pandas as pd
 import numpy as np
 from scipy.stats import linregress
@@ -7,11 +10,16 @@ import pytest
 from smps.io import load_sample
 import unittest
 
+
 class TestClass(unittest.TestCase):
 
+    @pytest.fixture(autouse=True)
+    def _datafile(self, datafile):
+        self.datafile = datafile
+
     def test_generic(self):
         res = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/sample-data/boston_wintertime.txt", 
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/sample-data/boston_wintertime.txt"), 
             column=False,
             as_dict=True
         )
@@ -34,7 +42,7 @@ class TestClass(unittest.TestCase):
         # test the scan stats
         stats = m.scan_stats
         assert isinstance(stats, pd.DataFrame)
-        assert list(stats.columns) == (list(set(m.data.columns) - set(m.dn.columns)))
+        assert list(stats.columns) == [c for c in m.data.columns if c not in m.dn.columns]
 
         # test stats
         stats = m.stats(weight='number')
@@ -79,21 +87,18 @@ class TestClass(unittest.TestCase):
 
     def test_generic_calculations(self):
         number = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt",
-            column=False, 
-            as_dict=False
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt"), 
+            column=False
         )
 
         surface = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_surface_area.txt",
-            column=False, 
-            as_dict=False
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_surface_area.txt"), 
+            column=False
         )
 
         volume = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_volume.txt",
-            column=False, 
-            as_dict=False
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_volume.txt"), 
+            column=False
         )
 
         # using the number data, compare our calculations using 'stats()' to
@@ -182,7 +187,7 @@ class TestClass(unittest.TestCase):
 
     def test_models_modulairpm(self):
         path_to_modpm = "https://raw.githubusercontent.com/quant-aq/py-smps/master/tests/datafiles/MOD-PM-SAMPLE.csv"
-        modpm_df = pd.read_csv(path_to_modpm)
+        modpm_df = pd.read_csv(self.datafile(path_to_modpm))
 
         modpm_model = smps.models.ModulairPM(data=modpm_df, fmt='dlogdn')
         
@@ -190,7 +195,7 @@ class TestClass(unittest.TestCase):
 
     def test_models_modulair(self):
         path_to_mod = "https://raw.githubusercontent.com/quant-aq/py-smps/master/tests/datafiles/MODULAIR-SAMPLE.csv"
-        mod_df = pd.read_csv(path_to_mod)
+        mod_df = pd.read_csv(self.datafile(path_to_mod))
 
         mod_model = smps.models.Modulair(data=mod_df)
 
@@ -203,9 +208,8 @@ class TestClass(unittest.TestCase):
         from smps.fit import LogNormal
 
         r = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt",
-            column=False, 
-            as_dict=False
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt"), 
+            column=False
         )
 
         # fit 1 mode in volume number space
@@ -215,9 +219,8 @@ class TestClass(unittest.TestCase):
 
     def test_calculations_with_nans(self):
         number = smps.io.smps_from_txt(
-            "https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt",
-            column=False, 
-            as_dict=False
+            self.datafile("https://raw.githubusercontent.com/dhhagan/py-smps/master/tests/datafiles/test_data_number.txt"), 
+            column=False
         )
 
         number.resample("1min", inplace=True)
@@ -239,3 +242,67 @@ class TestClass(unittest.TestCase):
         assert isinstance(obj.data, pd.DataFrame)
         assert isinstance(obj.bins, np.ndarray)
         assert isinstance(obj.bin_labels, list)
+
+    def test_dump_parquet(self):
+        pytest.importorskip("pyarrow")
+
+        datafile = os.path.join(os.path.dirname(__file__), "datafiles", "test_data_number.txt")
+        obj = smps.io.smps_from_txt(datafile, column=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "model.parquet")
+
+            saved = obj.dump(fpath, ftype="parquet")
+            self.assertEqual(len(saved), 2)
+
+            loaded = smps.io.load_parquet(fpath)
+
+        self.assertIsInstance(loaded, smps.SMPS)
+        self.assertEqual(loaded.bin_labels, obj.bin_labels)
+        np.testing.assert_allclose(loaded.bins, obj.bins)
+        pd.testing.assert_frame_equal(loaded.dndlogdp, obj.dndlogdp, check_freq=False)
+        pd.testing.assert_frame_equal(loaded.stats(), obj.stats(), check_freq=False)
+
+    def test_dump_parquet_roundtrip(self):
+        pytest.importorskip("pyarrow")
+
+        datafile = os.path.join(os.path.dirname(__file__), "datafiles", "MOD-PM-SAMPLE.csv")
+        df = pd.read_csv(datafile)
+
+        bin_weights = np.linspace(0.5, 1.5, 24)
+        obj = smps.models.ModulairPM(data=df, bin_weights=bin_weights, dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "model.parquet")
+
+            obj.dump(fpath, ftype="parquet")
+            loaded = smps.io.load_parquet(fpath)
+
+        self.assertIsInstance(loaded, smps.models.ModulairPM)
+        np.testing.assert_array_equal(loaded.bin_weights, bin_weights)
+        self.assertTrue((loaded.data[loaded.bin_labels].dtypes == np.float32).all())
+        pd.testing.assert_frame_equal(loaded.data, obj.data, check_freq=False)
+        pd.testing.assert_frame_equal(loaded.stats(), obj.stats(), check_freq=False)
+
+    def test_load_parquet_unknown_model(self):
+        pytest.importorskip("pyarrow")
+
+        datafile = os.path.join(os.path.dirname(__file__), "datafiles", "test_data_number.txt")
+        obj = smps.io.smps_from_txt(datafile, column=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "model.parquet")
+
+            obj.dump(fpath, ftype="parquet")
+
+            # only particle sizer models may be named in the metadata
+            for name in ("ValidationError", "make_bins", "NotAModel"):
+                with open(fpath + ".json", "r") as f:
+                    info = json.load(f)
+
+                info["model"] = name
+                with open(fpath + ".json", "w") as f:
+                    json.dump(info, f)
+
+                with self.assertRaises(smps.models.ValidationError):
+                    smps.io.load_parquet(fpath)
@@ -7,11 +7,16 @@ import pytest
 from smps.io import load_sample
 import unittest
 
+
 class TestClass(unittest.TestCase):
 
+    @pytest.fixture(autouse=True)
+    def _datafile(self, datafile):
+        self.datafile = datafile
+
     def test_variable_density(self):
         path = "https://raw.githubusercontent.com/quant-aq/py-smps/master/tests/datafiles/MOD-PM-SAMPLE.csv"
-        df = pd.read_csv(path)
+        df = pd.read_csv(self.datafile(path))
 
         # Create the object
         obj = smps.models.ModulairPM(data=df)
@@ -30,7 +35,9 @@ class TestClass(unittest.TestCase):
         
     def test_variable_kappa(self):
         path = "https://raw.githubusercontent.com/quant-aq/py-smps/master/tests/datafiles/MOD-PM-SAMPLE.csv"
-        df = pd.read_csv(path, parse_dates=['timestamp']).set_index("timestamp")
+        df = pd.read_csv(self.datafile(path))
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df = df.set_index("timestamp")
 
         # Create the object
         obj = smps.models.ModulairPM(data=df)
@@ -59,4 +66,42 @@ class TestClass(unittest.TestCase):
         pmx = obj.integrate(weight='mass', dmin=0., dmax=2.5, kappa=0.3, rh="sample_rh")
         pmy = obj.integrate(weight='mass', dmin=0., dmax=2.5, kappa=1, rh="sample_rh")
         
-        self.assertLess(pmy.mean(), pmx.mean())
\ No newline at end of file
+        self.assertLess(pmy.mean(), pmx.mean())
+
+    def test_partial_bins(self):
+        bins = smps.utils.make_bins(boundaries=np.array([0.3, 0.5, 1.0, 2.5]))
+        df = pd.DataFrame(np.ones((3, 3)), columns=["bin0", "bin1", "bin2"])
+
+        # with fmt='dn', each bin holds exactly 1 particle
+        obj = smps.models.GenericParticleSizer(data=df, bins=bins)
+
+        # the cut spans the upper half of bin0 and the lower half of bin1
+        pn = obj.integrate(weight='number', dmin=0.4, dmax=0.75)
+        np.testing.assert_allclose(pn.values, 1.)
+
+        # both edges of the cut fall within bin1
+        pn = obj.integrate(weight='number', dmin=0.6, dmax=0.8)
+        np.testing.assert_allclose(pn.values, 0.4)
+
+        # the cut falls outside of all bins
+        pn = obj.integrate(weight='number', dmin=5., dmax=10.)
+        np.testing.assert_allclose(pn.values, 0.)
+
+    def test_dtype(self):
+        bins = smps.utils.make_bins(boundaries=np.array([0.3, 0.5, 1.0, 2.5]))
+        df = pd.DataFrame(
+            np.random.uniform(1., 10., size=(10, 3)), 
+            columns=["bin0", "bin1", "bin2"]
+        )
+
+        obj = smps.models.GenericParticleSizer(data=df, bins=bins)
+        obj32 = smps.models.GenericParticleSizer(
+            data=df, bins=bins, dtype=np.float32)
+
+        self.assertTrue((obj32.dndlogdp.dtypes == np.float32).all())
+        self.assertTrue((obj32.dvdlogdp.dtypes == np.float32).all())
+
+        # calculations are carried out in float64
+        self.assertEqual(obj32.integrate(weight="volume").dtype, np.float64)
+        np.testing.assert_allclose(
+            obj32.stats(weight="volume"), obj.stats(weight="volume"), rtol=1e-5)
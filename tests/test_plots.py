@@ -0,0 +1,47 @@
+import smps
+import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import unittest
+
+class TestClass(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_heatmap_integer_counts(self):
+        X = pd.date_range("2023-01-01", periods=30, freq="5min")
+        Y = np.logspace(-2, 0, 20)
+        Z = np.arange(600).reshape(20, 30) - 10
+        Z0 = Z.copy()
+
+        ax = smps.plots.heatmap(X, Y, Z)
+        mesh = ax.collections[0]
+
+        # values below the colorbar minimum of 1 are raised to it
+        self.assertEqual(mesh.norm.vmin, 1.)
+        self.assertEqual(mesh.get_array().min(), 1.)
+        self.assertEqual(mesh.get_array().max(), Z.max())
+
+        # the original data is untouched
+        np.testing.assert_array_equal(Z, Z0)
+
+    def test_heatmap_max_cells(self):
+        X = pd.date_range("2023-01-01", periods=30, freq="5min")
+        Y = np.logspace(-2, 0, 20)
+        Z = np.random.uniform(1, 100, size=(20, 30))
+
+        # 1-D coordinates
+        ax = smps.plots.heatmap(X, Y, Z, max_cells=10)
+        self.assertEqual(ax.collections[0].get_array().shape, (10, 10))
+
+        # 2-D (meshgrid) coordinates
+        XX, YY = np.meshgrid(X, Y)
+        ax = smps.plots.heatmap(XX, YY, Z, max_cells=10)
+        self.assertEqual(ax.collections[0].get_array().shape, (10, 10))
+
+        # separate limits for each axis
+        ax = smps.plots.heatmap(XX, YY, Z, max_cells=(5, 10))
+        self.assertEqual(ax.collections[0].get_array().shape, (5, 10))
@@ -0,0 +1,72 @@
+import smps
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+from smps.utils import _download
+
+
+class TestClass(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_home = os.path.join(self.tmpdir.name, "cache")
+
+        # a local file stands in for the remote datafile
+        self.src = os.path.join(self.tmpdir.name, "datafile.txt")
+        with open(self.src, "w") as f:
+            f.write("a,b,c\n1,2,3\n")
+
+        self.url = pathlib.Path(self.src).as_uri()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_download_miss(self):
+        fpath = _download(self.url, data_home=self.data_home)
+
+        self.assertEqual(os.path.dirname(fpath), self.data_home)
+        self.assertTrue(fpath.endswith("datafile.txt"))
+
+        with open(fpath) as f:
+            self.assertEqual(f.read(), "a,b,c\n1,2,3\n")
+
+    def test_download_hit(self):
+        fpath = _download(self.url, data_home=self.data_home)
+
+        # the second call must not touch the network
+        with mock.patch("urllib.request.urlopen") as urlopen:
+            self.assertEqual(_download(self.url, data_home=self.data_home), fpath)
+
+        urlopen.assert_not_called()
+
+    def test_download_same_name(self):
+        other = os.path.join(self.tmpdir.name, "other")
+        os.makedirs(other)
+        with open(os.path.join(other, "datafile.txt"), "w") as f:
+            f.write("x,y,z\n")
+
+        fpath = _download(self.url, data_home=self.data_home)
+        fpath_other = _download(
+            pathlib.Path(other, "datafile.txt").as_uri(), data_home=self.data_home)
+
+        self.assertNotEqual(fpath, fpath_other)
+
+    def test_download_atomic(self):
+        # the file only appears in the cache through os.replace
+        with mock.patch("os.replace", wraps=os.replace) as replace:
+            fpath = _download(self.url, data_home=self.data_home)
+
+        replace.assert_called_once()
+        tmp, dst = replace.call_args[0]
+
+        self.assertEqual(dst, fpath)
+        self.assertEqual(os.path.dirname(tmp), self.data_home)
+
+        # an interrupted download leaves nothing behind
+        with mock.patch("urllib.request.urlopen", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                _download(self.url + "?v=2", data_home=self.data_home)
+
+        self.assertEqual(os.listdir(self.data_home), [os.path.basename(fpath)])